@@ -1,31 +1,35 @@
 import os
-import json
-from flask import Flask, request
 from telegram import Update
 from telegram.ext import ApplicationBuilder, CommandHandler, ContextTypes
 
-app = Flask(__name__)
-
 BOT_TOKEN = os.getenv("BOT_TOKEN")
 WEBHOOK_URL = os.getenv("WEBHOOK_URL")
 
-application = ApplicationBuilder().token(BOT_TOKEN).build()
+application = (
+    ApplicationBuilder()
+    .token(BOT_TOKEN)
+    .concurrent_updates(True)
+    .connection_pool_size(64)
+    .pool_timeout(30)
+    .connect_timeout(10)
+    .read_timeout(20)
+    .build()
+)
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text("Webhook bot is running!")
+    await update.message.reply_text("Bot is running!")
 
 application.add_handler(CommandHandler("start", start))
 
-@app.post("/webhook")
-def webhook():
-    data = request.get_json(force=True)
-    update = Update.de_json(data, application.bot)
-    application.create_task(application.process_update(update))
-    return "OK", 200
-
 if __name__ == "__main__":
-    application.run_webhook(
-        listen="0.0.0.0",
-        port=int(os.getenv("PORT", 8080)),
-        webhook_url=WEBHOOK_URL
-    )
+    # run_webhook serves the webhook itself, queues incoming updates on
+    # application.update_queue and drives initialize/start/stop for us.
+    # Without WEBHOOK_URL the same application falls back to polling.
+    if WEBHOOK_URL:
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=int(os.getenv("PORT", 8080)),
+            webhook_url=WEBHOOK_URL
+        )
+    else:
+        application.run_polling()